@@ -26,6 +26,8 @@ from trl import (
     CPOTrainer,
     DPOConfig,
     DPOTrainer,
+    GRPOConfig,
+    GRPOTrainer,
     KTOConfig,
     KTOTrainer,
     NashMDConfig,
@@ -205,6 +207,22 @@ class TrainerArgTester(unittest.TestCase):
             self.assertEqual(trainer.args.rpo_alpha, 0.5)
             self.assertEqual(trainer.args.discopop_tau, 0.1)
 
+    def test_grpo(self):
+        model_id = "trl-internal-testing/tiny-Qwen2ForCausalLM-2.5"
+        dataset = load_dataset("trl-internal-testing/zen", "standard_prompt_only", split="train")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            training_args = GRPOConfig(
+                tmp_dir,
+                vllm_enable_prefix_caching=True,
+            )
+            trainer = GRPOTrainer(
+                model=model_id,
+                reward_funcs="trl-internal-testing/tiny-Qwen2ForSequenceClassification-2.5",
+                args=training_args,
+                train_dataset=dataset,
+            )
+            self.assertEqual(trainer.args.vllm_enable_prefix_caching, True)
+
     def test_kto(self):
         model_id = "trl-internal-testing/tiny-Qwen2ForCausalLM-2.5"
         tokenizer = AutoTokenizer.from_pretrained(model_id)
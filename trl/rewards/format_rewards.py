@@ -15,6 +15,9 @@
 import re
 
 
+_THINK_FORMAT_PATTERN = re.compile(r"^<think>(?!.*<think>)(.*?)</think>.*$", re.DOTALL | re.MULTILINE)
+
+
 def think_format_reward(completions: list[list[dict[str, str]]], **kwargs) -> list[float]:
     r"""
     Reward function that checks if the reasoning process is enclosed within `"<think>"` and `"</think>"` tags. The
@@ -43,7 +46,6 @@ def think_format_reward(completions: list[list[dict[str, str]]], **kwargs) -> li
     [1.0, 0.0]
     ```
     """
-    pattern = r"^<think>(?!.*<think>)(.*?)</think>.*$"
     completion_contents = [completion[0]["content"] for completion in completions]
-    matches = [re.match(pattern, content, re.DOTALL | re.MULTILINE) for content in completion_contents]
+    matches = [_THINK_FORMAT_PATTERN.match(content) for content in completion_contents]
     return [1.0 if match else 0.0 for match in matches]
@@ -126,6 +126,11 @@ class GRPOConfig(TrainingArguments):
             Control the tensor parallel size for vLLM. This setting only applies when `vllm_mode` is set to
             `"colocate"`. If you are using `vllm_mode="server"`, this parameter must be passed separately when
             launching the vLLM server via the `--vllm_tensor_parallel_size` flag.
+        vllm_enable_prefix_caching (`bool` or `None`, *optional*, defaults to `None`):
+            Whether to enable prefix caching in vLLM. If set to `True`, ensure that the model and the hardware support
+            this feature. If `None`, vLLM's default is used, which enables it on the V1 engine. This setting only
+            applies when `vllm_mode` is set to `"colocate"`. If you are using `vllm_mode="server"`, this parameter
+            must be passed separately when launching the vLLM server via the `--enable_prefix_caching` flag.
 
         > Parameters that control the training
 
@@ -396,6 +401,16 @@ class GRPOConfig(TrainingArguments):
             "launching the vLLM server via the `--vllm_tensor_parallel_size` flag."
         },
     )
+    vllm_enable_prefix_caching: Optional[bool] = field(
+        default=None,
+        metadata={
+            "help": "Whether to enable prefix caching in vLLM. If set to `True`, ensure that the model and the "
+            "hardware support this feature. If `None`, vLLM's default is used, which enables it on the V1 engine. "
+            "This setting only applies when `vllm_mode` is set to `'colocate'`. If you are using "
+            "`vllm_mode='server'`, this parameter must be passed separately when launching the vLLM server via the "
+            "`--enable_prefix_caching` flag."
+        },
+    )
 
     # Parameters that control the training
     beta: float = field(
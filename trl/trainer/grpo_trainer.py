@@ -660,6 +660,7 @@ class GRPOTrainer(Trainer):
                     seed=self.accelerator.process_index // self.vllm_tensor_parallel_size,
                     # Latest vLLM v1 memory profiler is misled by the high default value (i.e., 32768) - thinking there's not enough memory
                     max_num_batched_tokens=4096,
+                    enable_prefix_caching=args.vllm_enable_prefix_caching,
                 )
 
             # vLLM specific sampling arguments